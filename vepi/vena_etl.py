@@ -28,16 +28,124 @@ Example usage:
     >>> client.cancel_job(job_id)
 """
 
+from __future__ import annotations
+
 import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from urllib3.util import make_headers
+from urllib3.util.retry import Retry
 import time
 import sys
-import pandas as pd
 import io
-from typing import Optional, Union, List, Dict, Any, TextIO
+import csv
+from typing import Optional, Union, List, Dict, Any, Iterable, Sequence, TextIO, TYPE_CHECKING
 import os
 from datetime import datetime
-from io import StringIO
+from urllib.parse import parse_qsl, quote, urlencode, urlsplit, urlunsplit
 import json
+import weakref
+import math
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# JSON encode/decode helpers: orjson when installed, otherwise the standard library
+if orjson is not None:
+    _loads = orjson.loads
+
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY)
+else:
+    _loads = json.loads
+
+    def _finite(obj: Any) -> Any:
+        if isinstance(obj, float):
+            return obj if math.isfinite(obj) else None
+        if isinstance(obj, dict):
+            return {key: _finite(value) for key, value in obj.items()}
+        if isinstance(obj, (list, tuple)):
+            return [_finite(value) for value in obj]
+        return obj
+
+    def _dumps(obj: Any) -> bytes:
+        try:
+            return json.dumps(obj, allow_nan=False).encode('utf-8')
+        except ValueError:
+            # NaN/Infinity aren't valid JSON; write them as null like orjson does
+            return json.dumps(_finite(obj), allow_nan=False).encode('utf-8')
+
+# numpy dtypes orjson serializes natively (OPT_SERIALIZE_NUMPY); float16 is not among them
+_ORJSON_NUMPY_DTYPES = frozenset([
+    'int8', 'int16', 'int32', 'int64',
+    'uint8', 'uint16', 'uint32', 'uint64',
+    'float32', 'float64',
+])
+
+if TYPE_CHECKING:
+    import aiohttp
+    import numpy as np
+    import pandas as pd
+    import pyarrow as pa
+
+
+def _response_json(response: requests.Response) -> Any:
+    """
+    Decode a JSON response body with the fastest available parser.
+    
+    Raises requests.exceptions.JSONDecodeError on invalid JSON, like
+    response.json(), so existing RequestException handlers still apply.
+    """
+    try:
+        return _loads(response.content)
+    except ValueError as e:
+        raise requests.exceptions.JSONDecodeError(str(e), response.text, 0)
+
+
+class _ChunkReader:
+    """
+    Minimal file-like object over an iterator of byte chunks, so ijson can
+    read from response.iter_content().
+    """
+
+    def __init__(self, chunks: Iterable[bytes]):
+        self._chunks = iter(chunks)
+        self._buffer = b''
+
+    def read(self, size: int = -1) -> bytes:
+        if size == 0:
+            return b''
+        while not self._buffer:
+            self._buffer = next(self._chunks, None)
+            if self._buffer is None:
+                self._buffer = b''
+                return b''
+        if size < 0:
+            data = self._buffer + b''.join(self._chunks)
+            self._buffer = b''
+            return data
+        data, self._buffer = self._buffer[:size], self._buffer[size:]
+        return data
+
+
+def _is_dataframe(obj: Any) -> bool:
+    """
+    Check whether obj is a pandas DataFrame without importing pandas.
+    
+    pandas is only imported by the methods that build DataFrames, since it is
+    slow to import. If it hasn't been imported yet, obj can't be a DataFrame.
+    """
+    pandas = sys.modules.get('pandas')
+    return pandas is not None and isinstance(obj, pandas.DataFrame)
+
 
 class VenaETL:
     """
@@ -88,34 +196,107 @@ class VenaETL:
         self.models_url = f'{self.closed_url}/models'
         self.processes_url = f'{self.closed_url}/processes'
         
-        # Headers for requests
-        self.headers = {
-            "accept": "application/json",
-            "content-type": "application/json",
-        }
-        
+        # Default headers for the session (see the headers property).
+        # accept-encoding lists every codec urllib3 can decode here (gzip,
+        # deflate, plus br/zstd when those packages are installed)
+        accept_encoding = make_headers(accept_encoding=True)['accept-encoding']
         self.file_headers = {
             "accept": "application/json",
+            "accept-encoding": accept_encoding,
         }
+        
+        # Cached get_dimension_hierarchy result: (fetched at, model ID, ETag, DataFrame)
+        self._hierarchy_cache = None
+        self.hierarchy_ttl_seconds = 300
+        
+        # DataFrames that already passed _validate_dataframe: id -> (weakref, shape)
+        self._validated_frames = {}
+        
+        # DataFrames larger than this are sent to startWithFile instead of startWithData
+        self.file_upload_threshold = 100_000
+        
+        # Shared session so every call reuses pooled keep-alive connections.
+        # No content-type is set session-wide: JSON bodies set it per call and
+        # requests fills in the multipart header (with boundary) for uploads.
+        self._session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=20,
+            pool_maxsize=50,
+            max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 502, 503, 504])
+        )
+        self._session.mount('http://', adapter)
+        self._session.mount('https://', adapter)
+        self._session.auth = (api_user, api_key)
+        self._session.headers.update(self.file_headers)
+
+    @property
+    def headers(self) -> CaseInsensitiveDict:
+        """
+        Headers sent with every request.
+        
+        This is the shared session's header dict, so changes apply to all
+        later calls. It has no content-type: JSON calls set it per request and
+        requests generates the multipart header for file uploads.
+        """
+        return self._session.headers
+
+    @headers.setter
+    def headers(self, value: Dict[str, str]) -> None:
+        # A session-wide content-type would break multipart uploads, so it is dropped
+        self._session.headers = CaseInsensitiveDict(
+            {key: val for key, val in value.items() if key.lower() != 'content-type'}
+        )
+
+    def close(self) -> None:
+        """
+        Close the underlying HTTP session and release pooled connections.
+        """
+        self._session.close()
+
+    def __enter__(self) -> 'VenaETL':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
 
     def _validate_dataframe(self, df: pd.DataFrame, required_columns: Optional[List[str]] = None) -> None:
         """
         Validate the DataFrame structure.
         
+        A frame that already passed validation without required_columns is not
+        re-checked on later calls, as long as it is the same object with the same
+        shape. In-place edits that keep the shape are not detected.
+        
         Args:
             df (pd.DataFrame): DataFrame to validate
             required_columns (List[str], optional): List of required column names
         """
-        if not isinstance(df, pd.DataFrame):
+        if not required_columns:
+            entry = self._validated_frames.get(id(df))
+            if entry is not None and entry[0]() is df and entry[1] == df.shape:
+                return
+        
+        if not _is_dataframe(df):
             raise ValueError("Input must be a pandas DataFrame")
             
         if df.empty:
             raise ValueError("DataFrame cannot be empty")
             
         if required_columns:
-            missing_columns = [col for col in required_columns if col not in df.columns]
+            # Index membership is a hash lookup too, but a plain set avoids its per-call overhead
+            column_set = set(df.columns)
+            missing_columns = [col for col in required_columns if col not in column_set]
             if missing_columns:
                 raise ValueError(f"DataFrame is missing required columns: {missing_columns}")
+        
+        # Remember the frame by identity; the weakref callback drops the entry
+        # once the frame is garbage collected so ids can't be confused on reuse
+        key = id(df)
+        validated_frames = self._validated_frames
+        validated_frames[key] = (
+            weakref.ref(df, lambda _, key=key: validated_frames.pop(key, None)),
+            df.shape
+        )
 
     def _convert_dataframe_to_array(self, df: pd.DataFrame) -> List[List[Any]]:
         """
@@ -128,50 +309,148 @@ class VenaETL:
             List[List[Any]]: Array of arrays representing the data
         """
         self._validate_dataframe(df)
-        return df.values.tolist()
+        # A single 2D to_numpy() + tolist() is a C-level row emitter. Building rows
+        # from per-column lists (or pyarrow's to_pylist) was measured slower, as
+        # the Python-level transpose costs more than the object-array upcast.
+        return df.to_numpy().tolist()
+
+    def _dataframe_rows(self, df: pd.DataFrame) -> Union[List[List[Any]], 'np.ndarray']:
+        """
+        Get the rows of a DataFrame in the cheapest form _stream_data_body can encode.
+        
+        When orjson is installed and every column has a plain numeric dtype, the
+        rows are returned as a C-contiguous 2D numpy array, which orjson encodes
+        without creating a Python object per cell. "Plain numeric" means the
+        numpy dtypes orjson can serialize (no float16, no nullable extension
+        types). Otherwise they are converted with _convert_dataframe_to_array.
+        
+        Args:
+            df (pd.DataFrame): DataFrame to convert
+            
+        Returns:
+            Union[List[List[Any]], np.ndarray]: Rows of the DataFrame
+        """
+        if orjson is not None and len(df.columns) and all(str(dtype) in _ORJSON_NUMPY_DTYPES for dtype in df.dtypes):
+            import numpy as np
+            self._validate_dataframe(df)
+            return np.ascontiguousarray(df.to_numpy())
+        return self._convert_dataframe_to_array(df)
+
+    def _stream_data_body(self, rows: Union[List[List[Any]], 'np.ndarray'], chunk_rows: int = 10000):
+        """
+        Yield the startWithData JSON body in chunks instead of one large string.
+        
+        Rows are encoded with orjson when it is installed, otherwise with the
+        standard json module.
+        
+        Args:
+            rows (Union[List[List[Any]], np.ndarray]): Array of arrays to send, or a 2D numeric
+                numpy array (requires orjson)
+            chunk_rows (int): Number of rows encoded per yielded chunk
+            
+        Yields:
+            bytes: Consecutive pieces of the JSON document
+        """
+        is_array = hasattr(rows, 'ndim')
+        yield b'{"input":{"data":['
+        for start in range(0, len(rows), chunk_rows):
+            if is_array:
+                # orjson encodes the whole slice natively; drop its outer brackets
+                chunk = _dumps(rows[start:start + chunk_rows])[1:-1]
+            else:
+                chunk = b','.join(_dumps(row) for row in rows[start:start + chunk_rows])
+            yield chunk if start == 0 else b',' + chunk
+        yield b']}}'
 
     def start_with_data(self, json_data: Union[pd.DataFrame, List[List[Any]]]) -> None:
         """
         Starts an ETL job with the provided JSON data and checks job status before completing.
         
+        DataFrames with more rows than file_upload_threshold are uploaded through
+        start_with_file instead, which is cheaper per row than the JSON endpoint.
+        Either way, API request failures are printed and the method returns None
+        rather than raising. Unlike start_with_file, it doesn't return the job ID.
+        
         Args:
             json_data (Union[pd.DataFrame, List[List[Any]]]): Data to import, either as a DataFrame or array of arrays
         """
-        if isinstance(json_data, pd.DataFrame):
-            json_data = self._convert_dataframe_to_array(json_data)
+        if _is_dataframe(json_data):
+            if len(json_data) > self.file_upload_threshold:
+                try:
+                    self.start_with_file(json_data)
+                except requests.exceptions.RequestException as e:
+                    print(f"Failed to start ETL job: {e}", file=sys.stderr)
+                return
+            json_data = self._dataframe_rows(json_data)
             
         try:
-            body = {"input": {"data": json_data}}
-            response = requests.post(
+            # Stream the body so the whole serialized payload is never held in memory
+            response = self._session.post(
                 self.start_with_data_url,
-                json=body,
-                auth=(self.api_user, self.api_key),
-                headers=self.headers
+                data=self._stream_data_body(json_data),
+                headers={"content-type": "application/json"}
             )
             response.raise_for_status()
-            job_id = response.json()['id']
+            job_id = _response_json(response)['id']
         except requests.exceptions.RequestException as e:
             print(f"Failed to start ETL job: {e}", file=sys.stderr)
             return
 
         self._monitor_job_status(job_id)
 
-    def _dataframe_to_csv_string(self, df: pd.DataFrame) -> str:
+    def _dataframe_to_csv_bytes(self, df: pd.DataFrame) -> bytes:
         """
-        Convert a DataFrame to a CSV string in the format required by Vena.
+        Convert a DataFrame to UTF-8 encoded CSV bytes in the format required by Vena.
+        
+        Values are stringified by the CSV writer itself and missing values are
+        written as empty fields, so no converted copy of the frame is made.
+        Frames made only of string and integer columns are written with
+        pyarrow's C++ CSV writer when pyarrow is installed. Anything else goes
+        through pandas so the formatting stays the same: pyarrow writes floats
+        like 1.0 as 1, booleans as true/false and timestamps with fractional
+        seconds.
         
         Args:
             df (pd.DataFrame): The DataFrame to convert
             
         Returns:
-            str: CSV string in the required format
+            bytes: UTF-8 encoded CSV data
         """
-        # Ensure all columns are strings
-        df = df.astype(str)
+        import pandas as pd
         
-        # Create CSV string
-        output = StringIO()
-        df.to_csv(output, index=False, header=True)
+        def arrow_compatible(column: pd.Series) -> bool:
+            dtype = column.dtype
+            if pd.api.types.is_bool_dtype(dtype):
+                return False
+            if pd.api.types.is_integer_dtype(dtype) or isinstance(dtype, pd.StringDtype):
+                return True
+            # Object columns only qualify if they hold nothing but strings (and missing values)
+            return dtype == object and pd.api.types.infer_dtype(column, skipna=True) == 'string'
+        
+        if all(arrow_compatible(df.iloc[:, i]) for i in range(df.shape[1])):
+            try:
+                import pyarrow as pa
+                from pyarrow import csv as pacsv
+            except ImportError:
+                pa = None
+            
+            if pa is not None:
+                try:
+                    table = pa.Table.from_pandas(df, preserve_index=False)
+                    body = pa.BufferOutputStream()
+                    pacsv.write_csv(table, body, pacsv.WriteOptions(include_header=False, quoting_style='needed'))
+                except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+                    # Fall back to pandas for anything arrow can't convert or write
+                    body = None
+                
+                if body is not None:
+                    # Write the header with the csv module so it is quoted the way pandas does
+                    header = io.StringIO()
+                    csv.writer(header, lineterminator='\n').writerow([str(col) for col in df.columns])
+                    return header.getvalue().encode('utf-8') + body.getvalue().to_pybytes()
+        
+        output = io.BytesIO()
+        df.to_csv(output, index=False, header=True, na_rep='', encoding='utf-8')
         return output.getvalue()
 
     def start_with_file(self, file: Union[str, pd.DataFrame, TextIO], filename: str = None) -> str:
@@ -204,11 +483,11 @@ class VenaETL:
                 if not filename:
                     filename = os.path.basename(file)
             
-            elif isinstance(file, pd.DataFrame):
+            elif _is_dataframe(file):
                 # DataFrame
                 if file.empty:
                     raise ValueError("DataFrame is empty")
-                file_content = self._dataframe_to_csv_string(file)
+                file_content = self._dataframe_to_csv_bytes(file)
                 if not filename:
                     filename = f"data_upload_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
             
@@ -242,39 +521,25 @@ class VenaETL:
             files = {
                 'file': (  # This key must match the partName in metadata
                     filename,
-                    file_content.encode('utf-8'),
+                    file_content.encode('utf-8') if isinstance(file_content, str) else file_content,
                     'text/csv; charset=utf-8'
                 ),
                 'metadata': (
                     'metadata.json',
-                    json.dumps(metadata).encode('utf-8'),
+                    _dumps(metadata),
                     'application/json'
                 )
             }
             
-            # Make the request with proper authentication and headers
-            response = requests.post(
-                url,
-                files=files,
-                auth=(self.api_user, self.api_key),
-                headers={
-                    "accept": "application/json"
-                }
-            )
-            
-            # Check for error response
-            if response.status_code >= 400:
-                try:
-                    error_data = response.json()
-                    error_msg = f"Error details: {error_data}"
-                except:
-                    error_msg = f"Error response: {response.text}"
-                raise requests.exceptions.RequestException(error_msg)
+            # Don't pass a content-type here: requests generates the
+            # multipart/form-data header with the matching boundary itself
+            response = self._session.post(url, files=files)
             
+            # Error bodies are parsed once, in the handler below
             response.raise_for_status()
             
             # Extract and return job ID
-            job_id = response.json().get('id')
+            job_id = _response_json(response).get('id')
             if not job_id:
                 raise ValueError("No job ID received from Vena API")
             
@@ -292,10 +557,47 @@ class VenaETL:
                     error_detail = e.response.json()
                     error_msg = f"{error_msg}\nDetails: {error_detail}"
                 except:
-                    pass
+                    error_msg = f"{error_msg}\nError response: {e.response.text}"
             print(f"Error starting ETL job: {error_msg}")
             raise
 
+    def _retry_after_delay(self, headers: Any, delay: float) -> float:
+        """
+        Return the server's requested polling interval, or delay if it sent none.
+        
+        Args:
+            headers: Response headers
+            delay (float): Current polling delay in seconds
+            
+        Returns:
+            float: Delay to use before the next status check
+        """
+        retry_after = headers.get("Retry-After")
+        if retry_after:
+            try:
+                return float(retry_after)
+            except ValueError:
+                pass
+        return delay
+
+    def _describe_job_error(self, error_data: Any) -> str:
+        """
+        Format the error details of a failed job for display.
+        
+        Args:
+            error_data: Decoded job details response
+            
+        Returns:
+            str: Error details prefixed with a newline, or an empty string
+        """
+        if 'error' in error_data:
+            return f"\nError details: {error_data['error']}"
+        elif 'message' in error_data:
+            return f"\nError message: {error_data['message']}"
+        elif isinstance(error_data, dict):
+            return f"\nError response: {error_data}"
+        return ""
+
     def _monitor_job_status(self, job_id: str) -> None:
         """
         Monitor the status of an ETL job.
@@ -304,17 +606,20 @@ class VenaETL:
             job_id (str): ID of the job to monitor
         """
         check_status_url = f'{self.base_url}/etl/jobs/{job_id}/status'
-        time.sleep(1)
+        # Poll quickly at first, then back off exponentially up to the cap
+        delay = 0.25
+        
+        # The status request never changes, so prepare it (URL, auth, headers) once
+        status_request = self._session.prepare_request(requests.Request('GET', check_status_url))
+        send_kwargs = self._session.merge_environment_settings(status_request.url, {}, None, None, None)
 
         while True:
             try:
-                status_response = requests.get(
-                    url=check_status_url,
-                    auth=(self.api_user, self.api_key),
-                    headers=self.headers
-                )
+                status_response = self._session.send(status_request, timeout=10, **send_kwargs)
                 status_response.raise_for_status()
-                job_status = status_response.json()
+                job_status = _response_json(status_response)
+                
+                delay = self._retry_after_delay(status_response.headers, delay)
 
                 if job_status == "COMPLETED":
                     print(f"Job {job_id} completed successfully.")
@@ -322,22 +627,12 @@ class VenaETL:
                 elif job_status in ["ERROR", "CANCELLED"]:
                     # Get error details if available
                     error_url = f'{self.base_url}/etl/jobs/{job_id}'
-                    error_response = requests.get(
-                        url=error_url,
-                        auth=(self.api_user, self.api_key),
-                        headers=self.headers
-                    )
+                    error_response = self._session.get(url=error_url)
                     
                     error_details = ""
                     if error_response.status_code == 200:
                         try:
-                            error_data = error_response.json()
-                            if 'error' in error_data:
-                                error_details = f"\nError details: {error_data['error']}"
-                            elif 'message' in error_data:
-                                error_details = f"\nError message: {error_data['message']}"
-                            elif isinstance(error_data, dict):
-                                error_details = f"\nError response: {error_data}"
+                            error_details = self._describe_job_error(error_response.json())
                         except:
                             error_details = f"\nError response: {error_response.text}"
                     
@@ -356,7 +651,8 @@ class VenaETL:
                 print(f"Error checking job status: {error_msg}", file=sys.stderr)
                 raise Exception(f"Failed to check job status: {error_msg}")
 
-            time.sleep(3)
+            time.sleep(delay)
+            delay = min(delay * 1.7, 30.0)
 
     def import_dataframe(self, df: pd.DataFrame) -> None:
         """
@@ -369,62 +665,522 @@ class VenaETL:
         self.start_with_data(df)
         print("Data Import Script Finished")
 
-    def export_data(self, page_size: int = 50000) -> Optional[pd.DataFrame]:
+    def start_with_data_batch(self, frames: Iterable[pd.DataFrame], max_rows_per_call: int = 500_000, max_parallel: int = 1) -> List[str]:
+        """
+        Import several DataFrames with as few ETL jobs as possible.
+        
+        The frames are concatenated and uploaded through start_with_file in
+        chunks of at most max_rows_per_call rows, instead of starting one job
+        per frame.
+        
+        Args:
+            frames (Iterable[pd.DataFrame]): DataFrames with the same columns
+            max_rows_per_call (int): Maximum number of rows per ETL job (default: 500000)
+            max_parallel (int): Maximum number of jobs started at once (default: 1, one after another)
+            
+        Returns:
+            List[str]: Job IDs of the started jobs, in chunk order
+            
+        Raises:
+            ValueError: If no frames are given or the combined DataFrame is empty
+            requests.exceptions.RequestException: If an API request fails
+        """
+        import pandas as pd
+        
+        frames = list(frames)
+        if not frames:
+            raise ValueError("At least one DataFrame is required")
+        if max_rows_per_call < 1:
+            raise ValueError("max_rows_per_call must be at least 1")
+        
+        df = pd.concat(frames, ignore_index=True)
+        self._validate_dataframe(df)
+        
+        # iloc row slices are views, so chunking doesn't copy the data
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        chunks = [
+            (df.iloc[start:start + max_rows_per_call], f"data_upload_{timestamp}_part{i + 1}.csv")
+            for i, start in enumerate(range(0, len(df), max_rows_per_call))
+        ]
+        print(f"Importing {len(df)} rows in {len(chunks)} ETL job(s)")
+        
+        if max_parallel > 1 and len(chunks) > 1:
+            with ThreadPoolExecutor(max_workers=min(max_parallel, len(chunks))) as executor:
+                return list(executor.map(lambda chunk: self.start_with_file(*chunk), chunks))
+        
+        return [self.start_with_file(chunk, filename) for chunk, filename in chunks]
+
+    def _rows_to_arrow(self, rows: List[List[Any]], headers: List[str]) -> 'pa.Table':
+        """
+        Build a pyarrow Table from a page of row-oriented intersection data.
+        
+        Args:
+            rows (List[List[Any]]): Data rows, without the header row
+            headers (List[str]): Column names
+            
+        Returns:
+            pa.Table: Table with one column per header
+        """
+        import pyarrow as pa
+        columns = list(zip(*rows)) or [[] for _ in headers]
+        return pa.Table.from_arrays([pa.array(col) for col in columns], names=headers)
+
+    def _read_export_page(self, response: requests.Response) -> tuple:
+        """
+        Parse one page of intersections data from a streamed response.
+        
+        When ijson is installed the body is parsed incrementally, so the raw
+        JSON document is never fully materialized alongside the rows.
+        Otherwise falls back to _response_json(response).
+        
+        Args:
+            response (requests.Response): Response opened with stream=True
+            
+        Returns:
+            tuple: (rows, metadata) where rows excludes the header row
+            
+        Raises:
+            requests.exceptions.JSONDecodeError: If the body is not valid JSON
+            requests.exceptions.ChunkedEncodingError: If the connection drops mid-body
+        """
+        if ijson is None:
+            data_response = _response_json(response)
+            return data_response['data'][1:], data_response['metadata']
+        
+        rows = []
+        metadata = {}
+        builder = None
+        target = None
+        header_seen = False
+        # iter_content decodes gzip/deflate and turns dropped connections into
+        # requests exceptions (ChunkedEncodingError, ConnectionError)
+        events = ijson.parse(_ChunkReader(response.iter_content(chunk_size=65536)), use_float=True)
+        try:
+            for prefix, event, value in events:
+                if builder is None:
+                    if (prefix, event) == ('data.item', 'start_array'):
+                        target = prefix
+                    elif (prefix, event) == ('metadata', 'start_map'):
+                        target = prefix
+                    else:
+                        continue
+                    builder = ijson.ObjectBuilder()
+            
+                builder.event(event, value)
+                if prefix == target and event in ('end_array', 'end_map'):
+                    if target == 'metadata':
+                        metadata = builder.value
+                    elif header_seen:
+                        rows.append(builder.value)
+                    else:
+                        # The first row of the data array contains the headers
+                        header_seen = True
+                    builder = None
+        except ijson.JSONError as e:
+            raise requests.exceptions.JSONDecodeError(str(e), '', 0)
+        
+        return rows, metadata
+
+    def _project_columns(self, frame: Any, headers: List[str], columns: Optional[Sequence[str]], as_arrow: bool) -> Any:
+        """
+        Keep only the requested columns of an export page.
+        
+        Args:
+            frame: Page as a DataFrame or pyarrow Table
+            headers (List[str]): Column names of the page
+            columns (Sequence[str], optional): Columns to keep; all columns are kept if not given
+            as_arrow (bool): Whether frame is a pyarrow Table
+            
+        Returns:
+            The projected frame
+            
+        Raises:
+            ValueError: If a requested column is not in the page headers
+        """
+        if not columns:
+            return frame
+        
+        header_set = set(headers)
+        unknown_columns = [col for col in columns if col not in header_set]
+        if unknown_columns:
+            raise ValueError(f"Requested columns not found in export: {unknown_columns}. Available columns: {headers}")
+        # Project in case the server ignored the fields parameter
+        if list(headers) != list(columns):
+            frame = frame.select(list(columns)) if as_arrow else frame[list(columns)]
+        return frame
+
+    def _fetch_export_page(self, url: str, as_arrow: bool, headers: Optional[List[str]] = None,
+                           columns: Optional[Sequence[str]] = None) -> tuple:
+        """
+        Fetch a single page of intersections data and convert it to a frame.
+        
+        Args:
+            url (str): URL of the page to fetch
+            as_arrow (bool): Build a pyarrow Table instead of a DataFrame
+            headers (List[str], optional): Column names; taken from the page metadata if not given
+            columns (Sequence[str], optional): Columns to keep; others returned by the server are dropped
+            
+        Returns:
+            tuple: (frame, metadata) for the page
+            
+        Raises:
+            ValueError: If a requested column is not in the page headers
+        """
+        with self._session.get(url, stream=True) as response:
+            response.raise_for_status()
+            rows, metadata = self._read_export_page(response)
+        
+        headers = headers or metadata['headers']
+        if as_arrow:
+            frame = self._rows_to_arrow(rows, headers)
+        else:
+            import pandas as pd
+            frame = pd.DataFrame(rows, columns=headers)
+        
+        return self._project_columns(frame, headers, columns, as_arrow), metadata
+
+    def _remaining_page_urls(self, metadata: Dict[str, Any], first_page_rows: int) -> Optional[List[str]]:
+        """
+        Build the URLs of pages 2..N from the first page's metadata, for parallel fetching.
+        
+        The URLs are derived from the server's own nextPage link by changing its
+        page parameter, and only if that link asks for page=2. Otherwise (no
+        page count, a cursor, 0-based or differently named paging) None is
+        returned and the caller should follow nextPage one page at a time.
+        
+        When only totalCount is reported, the page size is taken from what the
+        server actually sent rather than what was requested, since it may cap
+        it: the smaller of the link's pageSize and the first page's row count.
+        
+        Args:
+            metadata (Dict[str, Any]): Metadata of the first page
+            first_page_rows (int): Number of records on the first page
+            
+        Returns:
+            Optional[List[str]]: URLs of the remaining pages in order, or None
+        """
+        next_page_url = metadata.get('nextPage')
+        if not next_page_url:
+            return None
+        
+        parts = urlsplit(next_page_url)
+        params = parse_qsl(parts.query, keep_blank_values=True)
+        if [value for key, value in params if key == 'page'] != ['2']:
+            return None
+        
+        total_pages = metadata.get('totalPages')
+        if total_pages is None and metadata.get('totalCount') is not None:
+            page_sizes = [int(value) for key, value in params if key == 'pageSize' and value.isdigit()]
+            if first_page_rows:
+                page_sizes.append(first_page_rows)
+            page_size = min(page_sizes, default=0)
+            if page_size <= 0:
+                return None
+            total_pages = math.ceil(metadata['totalCount'] / page_size)
+        if not total_pages or total_pages <= 1:
+            return None
+        
+        return [
+            urlunsplit(parts._replace(query=urlencode([(key, str(i) if key == 'page' else value) for key, value in params])))
+            for i in range(2, total_pages + 1)
+        ]
+
+    def export_data(self, page_size: int = 50000, as_arrow: bool = False, max_parallel: int = 8,
+                    columns: Optional[Sequence[str]] = None) -> Optional[Union[pd.DataFrame, 'pa.Table']]:
         """
         Export intersections data from the Vena model with pagination support.
         
+        Each page is converted to a DataFrame (or Arrow table) as soon as it
+        arrives, and the pages are concatenated once at the end. When the first
+        page reports the total number of pages and its nextPage link asks for
+        page=2, the remaining pages are fetched concurrently; otherwise the
+        nextPage links are followed one by one.
+        
         Args:
             page_size (int): Number of records to fetch per page (default: 50000)
+            as_arrow (bool): Return a pyarrow Table instead of a DataFrame (requires pyarrow)
+            max_parallel (int): Maximum number of pages fetched at once (default: 8)
+            columns (Sequence[str], optional): Only export these columns. They are requested from
+                the server with the fields parameter and projected locally if it is ignored.
             
         Returns:
-            Optional[pd.DataFrame]: DataFrame containing all intersections data, or None if there was an error
+            Optional[Union[pd.DataFrame, pa.Table]]: All intersections data, or None if there was an error
+            
+        Raises:
+            ValueError: If the model ID is not set or a requested column doesn't exist
         """
         if not self.model_id:
             raise ValueError("Model ID must be set to export data")
+        
+        if as_arrow:
+            try:
+                import pyarrow as pa
+            except ImportError:
+                raise ImportError("pyarrow is required for as_arrow=True. Install it with 'pip install pyarrow'")
+            
+        query = f"pageSize={page_size}"
+        if columns:
+            query += f"&fields={quote(','.join(columns))}"
             
         try:
-            all_data = []
-            next_page_url = f"{self.intersections_url}?pageSize={page_size}"
+            # The first page tells us the headers and, ideally, how many pages there are
+            frame, metadata = self._fetch_export_page(f"{self.intersections_url}?{query}", as_arrow, columns=columns)
+            headers = metadata['headers']
+            frames = [frame]
+            total_records = len(frame)
             
-            while next_page_url:
-                # Make API request to get intersections data
-                response = requests.get(
-                    next_page_url,
-                    auth=(self.api_user, self.api_key),
-                    headers=self.headers
-                )
-                response.raise_for_status()
-                
-                # Load response into json
-                data_response = response.json()
+            urls = self._remaining_page_urls(metadata, total_records) if max_parallel > 1 else None
+            if urls:
+                workers = min(max_parallel, len(urls))
+                print(f"Fetching {len(urls)} more pages with {workers} workers... ({total_records} records so far)")
                 
-                # Skip the header row in data array and add the rest
-                all_data.extend(data_response['data'][1:])  # Skip the first row which contains headers
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    # map() yields results in page order regardless of completion order
+                    for frame, metadata in executor.map(lambda url: self._fetch_export_page(url, as_arrow, headers, columns), urls):
+                        frames.append(frame)
+                        total_records += len(frame)
+            
+            # Follow nextPage links one by one. After a parallel fetch this picks
+            # up any pages beyond the computed page count.
+            next_page_url = metadata.get('nextPage')
+            while next_page_url:
+                print(f"Fetching next page... ({total_records} records so far)")
+                frame, metadata = self._fetch_export_page(next_page_url, as_arrow, headers, columns)
+                frames.append(frame)
+                total_records += len(frame)
                 
                 # Check if there's a next page
-                next_page_url = data_response['metadata'].get('nextPage')
-                
-                # If there's a next page, use that URL directly
-                if next_page_url:
-                    print(f"Fetching next page... ({len(all_data)} records so far)")
-            
-            # Convert all data to DataFrame
-            intersections_df = pd.DataFrame(all_data)
+                next_page_url = metadata.get('nextPage')
             
-            # Set column names from metadata headers
-            intersections_df.columns = data_response['metadata']['headers']
+            if as_arrow:
+                # Each page's types are inferred separately, so an int64 column
+                # can come back as double, or as null on an all-empty page
+                intersections = pa.concat_tables(frames, promote_options="permissive")
+            else:
+                import pandas as pd
+                intersections = pd.concat(frames, ignore_index=True)
             
-            print(f"Total records fetched: {len(intersections_df)}")
-            return intersections_df
+            print(f"Total records fetched: {total_records}")
+            return intersections
             
         except requests.exceptions.RequestException as e:
             print(f"Failed to export data: {e}", file=sys.stderr)
             return None 
 
-    def get_dimension_hierarchy(self) -> pd.DataFrame:
+    def _aiohttp_session(self, max_connections: int = 50) -> 'aiohttp.ClientSession':
+        """
+        Create an aiohttp session for the async methods.
+        
+        Args:
+            max_connections (int): Maximum number of simultaneous connections (default: 50)
+            
+        Returns:
+            aiohttp.ClientSession: Session authenticated with the API credentials
+            
+        Raises:
+            ImportError: If aiohttp is not installed
+        """
+        try:
+            import aiohttp
+        except ImportError:
+            raise ImportError("aiohttp is required for the async methods. Install it with 'pip install aiohttp'")
+        
+        return aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=max_connections),
+            auth=aiohttp.BasicAuth(self.api_user, self.api_key),
+            headers={"accept": "application/json"}
+        )
+
+    async def _monitor_job_status_async(self, job_id: str, session: 'aiohttp.ClientSession') -> None:
+        """
+        Monitor the status of an ETL job without blocking the event loop.
+        
+        Args:
+            job_id (str): ID of the job to monitor
+            session (aiohttp.ClientSession): Session to poll with
+        """
+        import asyncio
+        import aiohttp
+        
+        check_status_url = f'{self.base_url}/etl/jobs/{job_id}/status'
+        # Poll quickly at first, then back off exponentially up to the cap
+        delay = 0.25
+
+        while True:
+            try:
+                async with session.get(check_status_url) as status_response:
+                    status_response.raise_for_status()
+                    job_status = _loads(await status_response.read())
+                    delay = self._retry_after_delay(status_response.headers, delay)
+
+                if job_status == "COMPLETED":
+                    print(f"Job {job_id} completed successfully.")
+                    break
+                elif job_status in ["ERROR", "CANCELLED"]:
+                    # Get error details if available
+                    error_details = ""
+                    async with session.get(f'{self.base_url}/etl/jobs/{job_id}') as error_response:
+                        if error_response.status == 200:
+                            error_text = await error_response.text()
+                            try:
+                                error_details = self._describe_job_error(_loads(error_text))
+                            except:
+                                error_details = f"\nError response: {error_text}"
+                    
+                    print(f"Job {job_id} ended with status: {job_status}{error_details}", file=sys.stderr)
+                    raise Exception(f"Job failed with status: {job_status}{error_details}")
+                else:
+                    print(f"Job {job_id} status: {job_status}")
+            except (aiohttp.ClientError, json.JSONDecodeError) as e:
+                print(f"Error checking job status: {e}", file=sys.stderr)
+                raise Exception(f"Failed to check job status: {e}")
+
+            await asyncio.sleep(delay)
+            delay = min(delay * 1.7, 30.0)
+
+    async def start_with_data_async(self, json_data: Union[pd.DataFrame, List[List[Any]]]) -> None:
+        """
+        Async version of start_with_data: start an ETL job with the provided data and wait for it to finish.
+        
+        DataFrames with more rows than file_upload_threshold are uploaded through
+        start_with_file on a worker thread. As with start_with_data, API request
+        failures are printed and the method returns None rather than raising.
+        
+        Args:
+            json_data (Union[pd.DataFrame, List[List[Any]]]): Data to import, either as a DataFrame or array of arrays
+            
+        Raises:
+            ImportError: If aiohttp is not installed
+        """
+        import asyncio
+        
+        if _is_dataframe(json_data):
+            if len(json_data) > self.file_upload_threshold:
+                try:
+                    await asyncio.to_thread(self.start_with_file, json_data)
+                except requests.exceptions.RequestException as e:
+                    print(f"Failed to start ETL job: {e}", file=sys.stderr)
+                return
+            json_data = self._dataframe_rows(json_data)
+        
+        import aiohttp
+        
+        async with self._aiohttp_session() as session:
+            try:
+                async with session.post(
+                    self.start_with_data_url,
+                    data=_dumps({"input": {"data": json_data}}),
+                    headers={"content-type": "application/json"}
+                ) as response:
+                    response.raise_for_status()
+                    job_id = _loads(await response.read())['id']
+            except (aiohttp.ClientError, json.JSONDecodeError) as e:
+                print(f"Failed to start ETL job: {e}", file=sys.stderr)
+                return
+            
+            await self._monitor_job_status_async(job_id, session)
+
+    async def export_data_async(self, page_size: int = 50000, max_parallel: int = 8,
+                                columns: Optional[Sequence[str]] = None) -> Optional[pd.DataFrame]:
+        """
+        Async version of export_data. Request failures and invalid JSON bodies
+        are printed and None is returned, as in export_data.
+        
+        Once the first page reports the total number of pages and its nextPage
+        link asks for page=2, up to max_parallel of the remaining pages are
+        kept in flight at a time.
+        Otherwise the nextPage links are followed one by one. Pages are
+        converted to DataFrames on worker threads so the event loop stays free.
+        
+        Args:
+            page_size (int): Number of records to fetch per page (default: 50000)
+            max_parallel (int): Maximum number of pages fetched at once (default: 8)
+            columns (Sequence[str], optional): Only export these columns
+            
+        Returns:
+            Optional[pd.DataFrame]: DataFrame containing all intersections data, or None if there was an error
+            
+        Raises:
+            ImportError: If aiohttp is not installed
+            ValueError: If the model ID is not set or a requested column doesn't exist
+        """
+        if not self.model_id:
+            raise ValueError("Model ID must be set to export data")
+        
+        import asyncio
+        import aiohttp
+        import pandas as pd
+        
+        query = f"pageSize={page_size}"
+        if columns:
+            query += f"&fields={quote(','.join(columns))}"
+        
+        def to_frame(body: bytes, headers: Optional[List[str]]) -> tuple:
+            data_response = _loads(body)
+            metadata = data_response['metadata']
+            headers = headers or metadata['headers']
+            frame = pd.DataFrame(data_response['data'][1:], columns=headers)
+            return self._project_columns(frame, headers, columns, False), metadata
+        
+        async def fetch_page(session: aiohttp.ClientSession, url: str, headers: Optional[List[str]] = None) -> tuple:
+            async with session.get(url) as response:
+                response.raise_for_status()
+                body = await response.read()
+            return await asyncio.to_thread(to_frame, body, headers)
+        
+        async with self._aiohttp_session() as session:
+            try:
+                # The first page tells us the headers and, ideally, how many pages there are
+                frame, metadata = await fetch_page(session, f"{self.intersections_url}?{query}")
+                headers = metadata['headers']
+                frames = [frame]
+                
+                urls = self._remaining_page_urls(metadata, len(frame))
+                if urls:
+                    print(f"Fetching {len(urls)} more pages, up to {max_parallel} at a time... ({len(frame)} records so far)")
+                    semaphore = asyncio.Semaphore(max(1, max_parallel))
+                    
+                    async def limited_fetch(url: str) -> tuple:
+                        async with semaphore:
+                            return await fetch_page(session, url, headers)
+                    
+                    # gather() returns results in page order
+                    results = await asyncio.gather(*[limited_fetch(url) for url in urls])
+                    frames.extend(frame for frame, _ in results)
+                    metadata = results[-1][1]
+                
+                # Follow nextPage links one by one. After a parallel fetch this
+                # picks up any pages beyond the computed page count.
+                next_page_url = metadata.get('nextPage')
+                while next_page_url:
+                    print(f"Fetching next page... ({sum(len(f) for f in frames)} records so far)")
+                    frame, metadata = await fetch_page(session, next_page_url, headers)
+                    frames.append(frame)
+                    
+                    # Check if there's a next page
+                    next_page_url = metadata.get('nextPage')
+                
+                intersections_df = pd.concat(frames, ignore_index=True)
+                print(f"Total records fetched: {len(intersections_df)}")
+                return intersections_df
+                
+            except (aiohttp.ClientError, json.JSONDecodeError) as e:
+                print(f"Failed to export data: {e}", file=sys.stderr)
+                return None
+
+    def get_dimension_hierarchy(self, force_refresh: bool = False) -> pd.DataFrame:
         """
         Get the dimension hierarchies from the Vena model.
         
+        The result is cached for hierarchy_ttl_seconds (default: 300). After
+        that the hierarchy is requested again with the ETag of the cached copy
+        (when the server sent one), so an unchanged hierarchy isn't downloaded
+        again. The returned DataFrame is a shallow copy of the cached one; use
+        .copy() before editing values in place.
+        
+        Args:
+            force_refresh (bool): Ignore the cache and fetch the full hierarchy
+        
         Returns:
             pd.DataFrame: DataFrame containing the dimension hierarchies with columns:
                 - dimension: The dimension name
@@ -433,33 +1189,45 @@ class VenaETL:
                 - parent: The parent member name
                 - operator: The operator for the member (+ or -)
         """
+        import pandas as pd
+        
         if not self.model_id:
             raise ValueError("Model ID must be set to get dimension hierarchies")
+        
+        cache = self._hierarchy_cache
+        if cache is not None and (force_refresh or cache[1] != self.model_id):
+            cache = None
+        if cache is not None and time.monotonic() - cache[0] < self.hierarchy_ttl_seconds:
+            print(f"Using cached dimension hierarchy ({len(cache[3])} members)")
+            return cache[3].copy(deep=False)
             
         try:
             # Construct the URL for the hierarchy endpoint
             hierarchy_url = f'{self.base_url}/models/{self.model_id}/hierarchy'
             
-            # Make the API request
-            response = requests.get(
-                hierarchy_url,
-                auth=(self.api_user, self.api_key),
-                headers=self.headers
-            )
+            # Make the API request, revalidating the cached copy if we have one
+            headers = {"If-None-Match": cache[2]} if cache is not None and cache[2] else None
+            response = self._session.get(hierarchy_url, headers=headers)
             response.raise_for_status()
             
+            if response.status_code == 304:
+                self._hierarchy_cache = (time.monotonic(),) + cache[1:]
+                print(f"Dimension hierarchy unchanged ({len(cache[3])} members)")
+                return cache[3].copy(deep=False)
+            
             # Parse the response
-            data = response.json()
+            data = _response_json(response)
             
             # Convert to DataFrame
             df = pd.DataFrame(data['data'])
+            self._hierarchy_cache = (time.monotonic(), self.model_id, response.headers.get('ETag'), df)
             
             # Print summary information
             print(f"Retrieved {len(df)} dimension hierarchy members")
             print("\nUnique dimensions:")
             print(df['dimension'].unique())
             
-            return df
+            return df.copy(deep=False)
             
         except requests.exceptions.RequestException as e:
             print(f"Failed to get dimension hierarchies: {e}", file=sys.stderr)
@@ -488,7 +1256,7 @@ class VenaETL:
         url = f"{self.job_status_url}/{job_id}/data"
         
         # Convert DataFrame to list of dictionaries if needed
-        if isinstance(data, pd.DataFrame):
+        if _is_dataframe(data):
             data = data.to_dict('records')
             
         body = {
@@ -496,14 +1264,13 @@ class VenaETL:
         }
         
         try:
-            response = requests.post(
+            response = self._session.post(
                 url,
-                headers=self.headers,
-                auth=(self.api_user, self.api_key),
-                json=body
+                data=_dumps(body),
+                headers={"content-type": "application/json"}
             )
             response.raise_for_status()
-            return response.json()
+            return _response_json(response)
         except requests.exceptions.HTTPError as e:
             if e.response.status_code == 422:
                 print(f"Error uploading data: {e.response.text}")
@@ -525,15 +1292,11 @@ class VenaETL:
             requests.exceptions.RequestException: If the API request fails
         """
         url = f"{self.base_url}/etl/templates/{self.template_id}/jobs"
-        response = requests.post(
-            url,
-            headers=self.headers,
-            auth=(self.api_user, self.api_key)
-        )
+        response = self._session.post(url)
         if response.status_code == 422:
             print(f"Error response content: {response.text}")
         response.raise_for_status()
-        return response.json().get('id')
+        return _response_json(response).get('id')
 
     def submit_job(self, job_id: str) -> Dict[str, Any]:
         """
@@ -549,15 +1312,11 @@ class VenaETL:
             requests.exceptions.RequestException: If the API request fails
         """
         url = f"{self.job_status_url}/{job_id}/submit"
-        response = requests.post(
-            url, 
-            headers=self.headers, 
-            auth=(self.api_user, self.api_key)
-        )
+        response = self._session.post(url)
         if response.status_code == 422:
             print(f"Error response content: {response.text}")
         response.raise_for_status()
-        return response.json()
+        return _response_json(response)
 
     def get_job_status(self, job_id: str) -> Dict[str, Any]:
         """
@@ -573,9 +1332,9 @@ class VenaETL:
             requests.exceptions.RequestException: If the API request fails
         """
         url = f"{self.job_status_url}/{job_id}"
-        response = requests.get(url, headers=self.headers, auth=(self.api_user, self.api_key))
+        response = self._session.get(url)
         response.raise_for_status()
-        return response.json()
+        return _response_json(response)
 
     def wait_for_job_completion(self, job_id: str, poll_interval: int = 5, timeout: int = 3600) -> Dict[str, Any]:
         """
@@ -707,19 +1466,15 @@ class VenaETL:
             requests.exceptions.RequestException: If the API request fails
         """
         url = f"{self.job_status_url}/{job_id}/cancel"
-        response = requests.post(
-            url,
-            headers=self.headers,
-            auth=(self.api_user, self.api_key)
-        )
+        response = self._session.post(url)
         response.raise_for_status()
-        return response.json() 
+        return _response_json(response) 
     
     def models(self) -> Dict[str, Any]:
         url = f"{self.models_url}"
-        response = requests.get(url, headers=self.headers, auth=(self.api_user, self.api_key))
+        response = self._session.get(url)
         response.raise_for_status()
-        return response.json()
+        return _response_json(response)
 
     def get_models(self):
         """
@@ -731,6 +1486,8 @@ class VenaETL:
                 - name: Model name
                 - desc: Model description
         """
+        import pandas as pd
+        
         try:
             # Get models data
             models_data = self.models()
@@ -751,9 +1508,9 @@ class VenaETL:
 
     def processes(self):
         url = f"{self.processes_url}"
-        response = requests.get(url, headers=self.headers, auth=(self.api_user, self.api_key))
+        response = self._session.get(url)
         response.raise_for_status()
-        return response.json()
+        return _response_json(response)
     
     def get_processes(self):
         """
@@ -767,6 +1524,8 @@ class VenaETL:
                 - processFolderId: Parent process folder ID
                 - allModels: List of associated models
         """
+        import pandas as pd
+        
         try:
             # Get processes data
             processes_data = self.processes()
@@ -824,15 +1583,11 @@ class VenaETL:
             url = f"{self.closed_url}/etl/v2/jobs?offset={offset}&requested=100&orderBy=id&orderDirection=desc"
             
             # Make the API request
-            response = requests.get(
-                url,
-                headers=self.headers,
-                auth=(self.api_user, self.api_key)
-            )
+            response = self._session.get(url)
             response.raise_for_status()
             
             # Parse and return the response
-            data = response.json()
+            data = _response_json(response)
             print(f"Retrieved {len(data.get('jobs', []))} jobs from history")
             return data
             